@@ -1,24 +1,34 @@
 import os
+import threading
 
-import gradio as gr
-import pandas as pd
-import matplotlib.pyplot as plt
-from PIL import Image
-from typing import Tuple, List
+# Keep OpenCV/BLAS single-threaded so preprocessing doesn't fight the ONNX
+# Runtime intra-op pool (which gets all cores) for CPU time. Must be set
+# before numpy/cv2 are imported anywhere.
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+os.environ.setdefault("MKL_NUM_THREADS", "1")
 
-from constants import MODEL_PATH, DATABASE_DIR, DATABASE_PATH
-from detector import SignatureDetector, download_model
+import cv2
 
+cv2.setNumThreads(1)
 
-def create_gradio_interface():
-    # Download model if it doesn't exist
-    if not os.path.exists(MODEL_PATH):
-        download_model()
-
-    # Initialize the detector
-    detector = SignatureDetector(MODEL_PATH)
+import gradio as gr
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple, List
 
-    css = """
+from constants import (
+    MODEL_PATH,
+    DATABASE_DIR,
+    DATABASE_PATH,
+    BATCH_SIZE,
+    EXAMPLE_IMAGES,
+)
+from detector import SignatureDetector
+
+# Static UI assets, defined once at import so interface rebuilds (hot
+# reload, tests) don't reconstruct multi-KB literals and the theme object.
+CSS = """
     .custom-button {
         background-color: #b0ffb8 !important;
         color: black !important;
@@ -53,41 +63,118 @@ def create_gradio_interface():
     }
     """
 
-    def process_image(image: Image.Image, conf_thres: float, iou_thres: float) -> Tuple[Image.Image, str, plt.Figure, plt.Figure, str, str]:
+HEADER_HTML = """
+    <h1>Tech4Humans - Signature Detector</h1>
+
+    <div style="display: flex; align-items: center; gap: 10px;">
+        <a href="https://huggingface.co/tech4humans/yolov8s-signature-detector">
+            <img src="https://huggingface.co/datasets/huggingface/badges/resolve/main/model-on-hf-md-dark.svg" alt="Model on HF">
+        </a>
+        <a href="https://huggingface.co/datasets/tech4humans/signature-detection">
+            <img src="https://huggingface.co/datasets/huggingface/badges/resolve/main/dataset-on-hf-md-dark.svg" alt="Dataset on HF">
+        </a>
+        <a href="https://github.com/tech4ai/t4ai-signature-detect-server">
+            <img src="https://img.shields.io/badge/github-%23121011.svg?style=for-the-badge&logo=github&logoColor=white" alt="GitHub">
+        </a>
+        <a href="https://huggingface.co/blog/samuellimabraz/signature-detection-model">
+            <img src="https://huggingface.co/datasets/huggingface/badges/resolve/main/paper-page-md-dark.svg" alt="Article">
+        </a>
+    </div>
+    """
+
+INTRO_MD = """
+    This system uses the [**YOLOv8s**](https://huggingface.co/tech4humans/yolov8s-signature-detector) model, specially fine-tuned for detecting handwritten signatures in document images.
+
+    With this detector, it is possible to identify signatures in digital documents with high accuracy in real time, making it ideal for applications involving validation, organization, and document processing.
+
+    ---
+    """
+
+ABOUT_MD = """
+    ---
+    ## About the Project
+
+    This project uses the YOLOv8s model fine-tuned for detecting handwritten signatures in document images. It was trained with data from the [Tobacco800](https://paperswithcode.com/dataset/tobacco-800) and [signatures-xc8up](https://universe.roboflow.com/roboflow-100/signatures-xc8up) datasets, undergoing preprocessing and data augmentation processes.
+
+    ### Key Metrics:
+    - **Precision:** 94.74%
+    - **Recall:** 89.72%
+    - **mAP@50:** 94.50%
+    - **mAP@50-95:** 67.35%
+    - **Inference Time (CPU):** 171.56 ms
+
+    Complete details on the training process, hyperparameter tuning, model evaluation, dataset creation, and inference server can be found in the links below.
+
+    ---
+
+    **Developed by [Tech4Humans](https://www.tech4h.com.br/)** | **Model:** [YOLOv8s](https://huggingface.co/tech4humans/yolov8s-signature-detector) | **Dataset:** [Tobacco800 + signatures-xc8up](https://huggingface.co/datasets/tech4humans/signature-detection)
+    """
+
+THEME = gr.themes.Soft(
+    primary_hue="indigo", secondary_hue="gray", neutral_hue="gray"
+)
+
+
+def create_gradio_interface():
+    # Initialize the detector; the model download and session build both
+    # happen lazily on first use, so kick them off in the background while
+    # the UI comes up instead of blocking startup on the download.
+    detector = SignatureDetector(MODEL_PATH)
+    threading.Thread(target=detector._ensure_session, daemon=True).start()
+
+    def detect_image(image, conf_thres: float, iou_thres: float):
+        """Latency-critical path: run detection and return only the image."""
         if image is None:
-            return None, None, None, None, None, None
+            return None
 
-        output_image, metrics = detector.detect(image, conf_thres, iou_thres)
+        output_image, _ = detector.detect(image, conf_thres, iou_thres)
+        return output_image
 
-        # Create plots data
-        hist_data = pd.DataFrame({"Time (ms)": metrics["times"]})
-        indices = range(
-            metrics["start_index"], metrics["start_index"] + len(metrics["times"])
+    def build_plot_data(metrics: dict) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Bin the metrics into the data frames the native plots render."""
+        times = np.asarray(metrics["times"], dtype=np.float32)
+        counts, edges = np.histogram(times, bins=20)
+        hist_data = pd.DataFrame(
+            {"Time (ms)": (edges[:-1] + edges[1:]) / 2, "Frequency": counts}
         )
-
+        start_index = metrics["start_index"]
         line_data = pd.DataFrame(
             {
-                "Inference": indices,
-                "Time (ms)": metrics["times"],
-                "Mean": [metrics["avg_time"]] * len(metrics["times"]),
+                "Inference": np.arange(start_index, start_index + len(times)),
+                "Time (ms)": times,
             }
         )
+        return hist_data, line_data
 
-        hist_fig, line_fig = detector.create_plots(hist_data, line_data)
+    def update_metrics_display() -> Tuple[str, pd.DataFrame, pd.DataFrame, str, str]:
+        """Build the metric widgets after the detection image is delivered."""
+        metrics = detector.get_metrics()
+        if not metrics["times"]:
+            return None, None, None, None, None
+
+        hist_data, line_data = build_plot_data(metrics)
 
         return (
-            output_image,
             gr.update(
                 value=f"{metrics['total_inferences']}",
                 container=True,
             ),
-            hist_fig,
-            line_fig,
+            hist_data,
+            line_data,
             f"{metrics['avg_time']:.2f}",
             f"{metrics['times'][-1]:.2f}",
         )
 
-    def process_folder(files_paths: List[str], conf_thres: float, iou_thres: float):
+    def load_metrics_display():
+        """Initial metrics shown on page load."""
+        return (None,) + update_metrics_display()
+
+    def process_folder(
+        files_paths: List[str],
+        conf_thres: float,
+        iou_thres: float,
+        progress=gr.Progress(),
+    ):
         if not files_paths:
             return None, None, None, None, None, None
 
@@ -99,52 +186,57 @@ def create_gradio_interface():
         if not image_files:
             return None, None, None, None, None, None
 
-        for img_file in image_files:
-            image = Image.open(img_file)
+        def load_chunk(paths: List[str]):
+            # cv2.imread decodes straight to a uint8 array (libjpeg-turbo
+            # SIMD paths), skipping the PIL object and its later ndarray
+            # conversion; only the cheap channel swap to RGB remains.
+            return [
+                cv2.cvtColor(cv2.imread(f, cv2.IMREAD_COLOR), cv2.COLOR_BGR2RGB)
+                for f in paths
+            ]
+
+        chunks = [
+            image_files[start : start + BATCH_SIZE]
+            for start in range(0, len(image_files), BATCH_SIZE)
+        ]
+
+        # Process the folder in batches: one session.run per BATCH_SIZE
+        # images amortizes inference overhead, while yielding per image
+        # keeps the streaming UX. The next chunk is decoded in a worker
+        # thread while the current one runs inference, so JPEG decode
+        # overlaps with the model instead of serializing with it.
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            pending = prefetcher.submit(load_chunk, chunks[0])
+            for index in progress.tqdm(range(len(chunks)), desc="Processing images"):
+                images = pending.result()
+                if index + 1 < len(chunks):
+                    pending = prefetcher.submit(load_chunk, chunks[index + 1])
+
+                output_images, _ = detector.detect_batch(
+                    images, conf_thres, iou_thres
+                )
 
-            yield process_image(image, conf_thres, iou_thres)
+                # One UI update per batch instead of per image: the progress
+                # bar tracks completion while each yield shows the batch's
+                # last result and cumulative metrics, cutting websocket
+                # payloads by the batch factor.
+                yield (output_images[-1],) + update_metrics_display()
 
     with gr.Blocks(
-        theme=gr.themes.Soft(
-            primary_hue="indigo", secondary_hue="gray", neutral_hue="gray"
-        ),
-        css=css,
+        theme=THEME,
+        css=CSS,
+        analytics_enabled=False,
     ) as iface:
-        gr.HTML(
-            """
-            <h1>Tech4Humans - Signature Detector</h1>
-    
-            <div style="display: flex; align-items: center; gap: 10px;">
-                <a href="https://huggingface.co/tech4humans/yolov8s-signature-detector">
-                    <img src="https://huggingface.co/datasets/huggingface/badges/resolve/main/model-on-hf-md-dark.svg" alt="Model on HF">
-                </a>
-                <a href="https://huggingface.co/datasets/tech4humans/signature-detection">
-                    <img src="https://huggingface.co/datasets/huggingface/badges/resolve/main/dataset-on-hf-md-dark.svg" alt="Dataset on HF">
-                </a>
-                <a href="https://github.com/tech4ai/t4ai-signature-detect-server">
-                    <img src="https://img.shields.io/badge/github-%23121011.svg?style=for-the-badge&logo=github&logoColor=white" alt="GitHub">
-                </a>
-                <a href="https://huggingface.co/blog/samuellimabraz/signature-detection-model">
-                    <img src="https://huggingface.co/datasets/huggingface/badges/resolve/main/paper-page-md-dark.svg" alt="Article">
-                </a>
-            </div>
-            """
-        )
-        gr.Markdown(
-            """
-            This system uses the [**YOLOv8s**](https://huggingface.co/tech4humans/yolov8s-signature-detector) model, specially fine-tuned for detecting handwritten signatures in document images.
-           
-            With this detector, it is possible to identify signatures in digital documents with high accuracy in real time, making it ideal for applications involving validation, organization, and document processing.
-            
-            ---
-            """
-        )
+        gr.HTML(HEADER_HTML)
+        gr.Markdown(INTRO_MD)
 
         with gr.Row(equal_height=True, elem_classes="main-container"):
             # Left column for controls and information
             with gr.Column(scale=1):
                 with gr.Tab("Single Image"):
-                    input_image = gr.Image(label="Upload your document", type="pil")
+                    # numpy hands the decoded array to the detector directly,
+                    # skipping the PIL round-trip copy that type="pil" incurs
+                    input_image = gr.Image(label="Upload your document", type="numpy")
                     with gr.Row():
                         clear_single_btn = gr.ClearButton([input_image], value="Clear")
                         detect_single_btn = gr.Button(
@@ -187,15 +279,14 @@ def create_gradio_interface():
                 with gr.Accordion("Examples", open=True):
                     gr.Examples(
                         label="Image Examples",
-                        examples=[
-                            ["assets/images/example_{i}.jpg".format(i=i)]
-                            for i in range(
-                                0, len(os.listdir(os.path.join("assets", "images")))
-                            )
-                        ],
+                        examples=[[path] for path in EXAMPLE_IMAGES],
                         inputs=input_image,
                         outputs=output_image,
                         fn=detector.detect_example,
+                        # Lazy: each example is cached on first click instead
+                        # of blocking launch() on a full warmup pass, which
+                        # would also force the model download before the
+                        # server comes up.
                         cache_examples=True,
                         cache_mode="lazy",
                     )
@@ -205,10 +296,23 @@ def create_gradio_interface():
                 total_inferences = gr.Textbox(
                     label="Total Inferences", show_copy_button=True, container=True
                 )
-                hist_plot = gr.Plot(label="Time Distribution", container=True)
+                # Native Gradio plots ship only the data arrays to the
+                # browser and render client-side, instead of rasterizing
+                # matplotlib PNGs on the server for every update.
+                hist_plot = gr.BarPlot(
+                    x="Time (ms)",
+                    y="Frequency",
+                    label="Time Distribution",
+                    container=True,
+                )
 
             with gr.Column(scale=1):
-                line_plot = gr.Plot(label="Time History", container=True)
+                line_plot = gr.LinePlot(
+                    x="Inference",
+                    y="Time (ms)",
+                    label="Time History",
+                    container=True,
+                )
                 with gr.Row(elem_classes="metrics-row"):
                     avg_inference_time = gr.Textbox(
                         label="Average Inference Time (ms)",
@@ -223,36 +327,23 @@ def create_gradio_interface():
 
         with gr.Row(elem_classes="container"):
 
-            gr.Markdown(
-                """
-                ---
-                ## About the Project
-
-                This project uses the YOLOv8s model fine-tuned for detecting handwritten signatures in document images. It was trained with data from the [Tobacco800](https://paperswithcode.com/dataset/tobacco-800) and [signatures-xc8up](https://universe.roboflow.com/roboflow-100/signatures-xc8up) datasets, undergoing preprocessing and data augmentation processes.
-
-                ### Key Metrics:
-                - **Precision:** 94.74%
-                - **Recall:** 89.72%
-                - **mAP@50:** 94.50%
-                - **mAP@50-95:** 67.35%
-                - **Inference Time (CPU):** 171.56 ms
-
-                Complete details on the training process, hyperparameter tuning, model evaluation, dataset creation, and inference server can be found in the links below.
-                
-                ---
-
-                **Developed by [Tech4Humans](https://www.tech4h.com.br/)** | **Model:** [YOLOv8s](https://huggingface.co/tech4humans/yolov8s-signature-detector) | **Dataset:** [Tobacco800 + signatures-xc8up](https://huggingface.co/datasets/tech4humans/signature-detection)
-                """
-            )
+            gr.Markdown(ABOUT_MD)
 
         clear_single_btn.add([output_image])
         clear_folder_btn.add([output_image])
 
+        # The detection image is returned as soon as inference finishes; the
+        # metric plot data is built in a chained event off the critical path
+        # so the user never waits on it.
         detect_single_btn.click(
-            fn=process_image,
+            fn=detect_image,
             inputs=[input_image, confidence_threshold, iou_threshold],
+            outputs=[output_image],
+            concurrency_id="detector",
+        ).then(
+            fn=update_metrics_display,
+            inputs=None,
             outputs=[
-                output_image,
                 total_inferences,
                 hist_plot,
                 line_plot,
@@ -264,6 +355,7 @@ def create_gradio_interface():
         detect_folder_btn.click(
             fn=process_folder,
             inputs=[input_folder, confidence_threshold, iou_threshold],
+            concurrency_id="detector",
             outputs=[
                 output_image,
                 total_inferences,
@@ -276,7 +368,7 @@ def create_gradio_interface():
 
         # Carregar métricas iniciais ao carregar a página
         iface.load(
-            fn=detector.load_initial_metrics,
+            fn=load_metrics_display,
             inputs=None,
             outputs=[
                 output_image,
@@ -296,4 +388,9 @@ if __name__ == "__main__":
         os.makedirs(DATABASE_DIR, exist_ok=True)
     
     iface = create_gradio_interface()
-    iface.launch(ssr_mode=False, share=True)
+    # Detector-bound events share one concurrency slot (concurrency_id
+    # above) so the single-image and folder flows never run inference at
+    # the same time; the detector's own lock covers callers outside the
+    # queue, such as example caching.
+    iface.queue(default_concurrency_limit=1, max_size=32)
+    iface.launch(ssr_mode=False, share=True, show_api=False)
@@ -1,8 +1,26 @@
 import os
+import re
 
 REPO_ID = "tech4humans/yolov8s-signature-detector"
 FILENAME = "yolov8s.onnx"
 MODEL_DIR = "model"
 MODEL_PATH = os.path.join(MODEL_DIR, "model.onnx")
+MODEL_PATH_INT8 = os.path.join(MODEL_DIR, "model.int8.onnx")
 DATABASE_DIR = os.path.join(os.getcwd(), "db")
 DATABASE_PATH = os.path.join(DATABASE_DIR, "metrics.db")
+
+# Number of images stacked into one inference call by the folder/PDF flows.
+BATCH_SIZE = 8
+
+# Example images for the Gradio UI, listed once at import instead of on
+# every interface build. Sorting by the numeric suffix keeps example_10
+# after example_9 instead of lexicographic order.
+ASSETS_IMAGES_DIR = os.path.join("assets", "images")
+_EXAMPLE_PATTERN = re.compile(r"example_(\d+)\.jpg")
+EXAMPLE_IMAGES = [
+    os.path.join(ASSETS_IMAGES_DIR, name)
+    for name in sorted(
+        (n for n in os.listdir(ASSETS_IMAGES_DIR) if _EXAMPLE_PATTERN.fullmatch(n)),
+        key=lambda n: int(_EXAMPLE_PATTERN.fullmatch(n).group(1)),
+    )
+]
@@ -1,18 +1,77 @@
+import hashlib
 import os
+import threading
 import time
 
 import cv2
+import matplotlib
+
+# Headless backend: figures are only ever rasterized for Gradio, never shown.
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
+
+plt.style.use("dark_background")
 from PIL import Image
 import numpy as np
 import onnxruntime as ort
-import pandas as pd
 from typing import Tuple
+from filelock import FileLock
 from huggingface_hub import hf_hub_download
 
-from constants import REPO_ID, FILENAME, MODEL_DIR, MODEL_PATH
+from constants import REPO_ID, FILENAME, MODEL_DIR, MODEL_PATH, MODEL_PATH_INT8
 from metrics_storage import MetricsStorage
 
+# Execution providers in order of preference. The session is created with the
+# intersection of this list and what the installed ONNX Runtime build actually
+# supports, so the same code runs on GPU (TensorRT/CUDA), Intel CPU/iGPU
+# (OpenVINO), Apple (CoreML), Windows (DirectML) or plain CPU.
+PROVIDER_PRIORITY = [
+    "TensorrtExecutionProvider",
+    "CUDAExecutionProvider",
+    "OpenVINOExecutionProvider",
+    "CoreMLExecutionProvider",
+    "DmlExecutionProvider",
+    "CPUExecutionProvider",
+]
+
+PROVIDER_OPTIONS = {
+    "TensorrtExecutionProvider": {
+        "trt_engine_cache_enable": True,
+        "trt_engine_cache_path": os.path.join(MODEL_DIR, ".trt_cache"),
+        "trt_fp16_enable": True,
+        "trt_max_workspace_size": 2 << 30,
+    },
+    "CUDAExecutionProvider": {"device_id": 0},
+    # device_type selects both the device and the inference precision, e.g.
+    # "CPU_FP16" halves weight memory traffic on CPUs with FP16 vector units
+    # while OpenVINO keeps FP32 I/O at the graph boundary.
+    "OpenVINOExecutionProvider": {
+        "device_type": os.getenv("OPENVINO_DEVICE", "CPU"),
+        "num_of_threads": os.cpu_count() or 4,
+    },
+}
+
+
+def select_providers():
+    """
+    Build a prioritized execution provider list for the current runtime.
+
+    Returns:
+        list: Provider names (or (name, options) tuples) supported by this
+            ONNX Runtime build, best first.
+    """
+    available = ort.get_available_providers()
+    providers = []
+
+    for name in PROVIDER_PRIORITY:
+        if name in available:
+            options = PROVIDER_OPTIONS.get(name)
+            if name == "TensorrtExecutionProvider":
+                os.makedirs(options["trt_engine_cache_path"], exist_ok=True)
+            providers.append((name, options) if options else name)
+
+    return providers or ["CPUExecutionProvider"]
+
 
 def download_model():
     """Download the model using Hugging Face Hub"""
@@ -20,26 +79,33 @@ def download_model():
     os.makedirs(MODEL_DIR, exist_ok=True)
 
     try:
-        print(f"Downloading model from {REPO_ID}...")
-        # Download the model file from Hugging Face Hub
-        model_path = hf_hub_download(
-            repo_id=REPO_ID,
-            filename=FILENAME,
-            local_dir=MODEL_DIR,
-            cache_dir=None,
-            token=os.getenv("HF_TOKEN"),
-        )
-
-        # Move the file to the correct location if it's not there already
-        if os.path.exists(model_path) and model_path != MODEL_PATH:
-            os.rename(model_path, MODEL_PATH)
-
-            # Remove empty directories if they exist
-            empty_dir = os.path.join(MODEL_DIR, "tune")
-            if os.path.exists(empty_dir):
-                import shutil
-
-                shutil.rmtree(empty_dir)
+        # Serialize the download + rename across processes (Gradio reload can
+        # start several workers) so no one ever sees a partial model file.
+        with FileLock(MODEL_PATH + ".lock"):
+            if os.path.exists(MODEL_PATH):
+                return MODEL_PATH
+
+            print(f"Downloading model from {REPO_ID}...")
+            # Download the model file from Hugging Face Hub, reusing its
+            # content-addressed cache when the file is already present
+            model_path = hf_hub_download(
+                repo_id=REPO_ID,
+                filename=FILENAME,
+                local_dir=MODEL_DIR,
+                cache_dir=None,
+                token=os.getenv("HF_TOKEN"),
+            )
+
+            # Move the file to the correct location if it's not there already
+            if os.path.exists(model_path) and model_path != MODEL_PATH:
+                os.rename(model_path, MODEL_PATH)
+
+                # Remove empty directories if they exist
+                empty_dir = os.path.join(MODEL_DIR, "tune")
+                if os.path.exists(empty_dir):
+                    import shutil
+
+                    shutil.rmtree(empty_dir)
 
         print("Model downloaded successfully!")
         return MODEL_PATH
@@ -53,19 +119,166 @@ class SignatureDetector:
     def __init__(self, model_path: str = MODEL_PATH):
         self.model_path = model_path
         self.classes = ["signature"]
+        # One fixed color per class; with a single class there is nothing to
+        # randomize.
+        self.color_palette = [(0, 255, 0)]
         self.input_width = 640
         self.input_height = 640
 
-        # Initialize ONNX Runtime session
-        options = ort.SessionOptions()
-        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_DISABLE_ALL
-        self.session = ort.InferenceSession(self.model_path, options)
-        self.session.set_providers(
-            ["OpenVINOExecutionProvider"], [{"device_type": "CPU"}]
+        # The label text is constant up to the score digits, so its geometry
+        # can be measured once instead of per drawn box.
+        (self.label_width, self.label_height), _ = cv2.getTextSize(
+            f"{self.classes[0]}: 0.00", cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1
         )
 
+        # Scratch buffer reused by every resize so preprocessing doesn't
+        # allocate a fresh 640x640x3 image per request.
+        self._resize_buf = np.empty(
+            (self.input_height, self.input_width, 3), np.uint8
+        )
+
+        # The ONNX Runtime session is built lazily on first use (or from a
+        # background warmup thread) so constructing the detector doesn't block
+        # app startup on graph optimization or TensorRT engine builds.
+        self._session = None
+        self._session_lock = threading.Lock()
+
+        # The detector carries per-call state (letterbox canvas and geometry,
+        # the bound input buffer, the last-output cache), so concurrent
+        # Gradio events must not interleave detect/detect_batch. Reentrant so
+        # detect may call run_inference while holding it.
+        self._infer_lock = threading.RLock()
+
+        # Raw model output for the most recent input, keyed by a hash of the
+        # letterboxed canvas; threshold-only changes skip session.run.
+        self._last_img_hash = None
+        self._last_outputs = None
+
+        # Metric figures are created once and redrawn in place on refresh;
+        # rebuilding matplotlib figures per inference costs tens of ms each.
+        self._hist_fig = None
+        self._hist_ax = None
+        self._line_fig = None
+        self._line_ax = None
+        # Memoize the last rendered figures so concurrent page loads (which
+        # all call load_initial_metrics with identical data) skip redrawing.
+        self._plot_cache_key = None
+
         self.metrics_storage = MetricsStorage()
 
+    @property
+    def session(self):
+        self._ensure_session()
+        return self._session
+
+    def _ensure_session(self) -> None:
+        """Creates and warms up the ONNX Runtime session on first use."""
+        if self._session is not None:
+            return
+
+        with self._session_lock:
+            if self._session is not None:
+                return
+
+            # The download is deferred to first session use so app startup
+            # never blocks on it; download_model() is idempotent and
+            # cross-process safe behind its file lock.
+            if not os.path.exists(self.model_path):
+                download_model()
+
+            providers = select_providers()
+
+            # On CPU-class providers prefer the INT8 quantized model when it
+            # has been generated (see quantize.py); GPU providers stay on
+            # FP32/FP16.
+            first_provider = (
+                providers[0][0] if isinstance(providers[0], tuple) else providers[0]
+            )
+            if first_provider not in (
+                "TensorrtExecutionProvider",
+                "CUDAExecutionProvider",
+            ) and os.path.exists(MODEL_PATH_INT8):
+                self.model_path = MODEL_PATH_INT8
+
+            # Initialize ONNX Runtime session with the best available
+            # provider. The fully optimized graph is persisted next to the
+            # model on the first run; warm starts load it directly and skip
+            # the constant-folding/fusion passes entirely.
+            options = ort.SessionOptions()
+            optimized_path = self.model_path + ".opt.onnx"
+            if os.path.exists(optimized_path):
+                self.model_path = optimized_path
+                options.graph_optimization_level = (
+                    ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+                )
+            else:
+                options.graph_optimization_level = (
+                    ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+                )
+                options.optimized_model_filepath = optimized_path
+            # Default to one worker per core; deployments on SMT or shared
+            # hosts can pin the pool to physical cores via the env override.
+            options.intra_op_num_threads = int(
+                os.getenv("ORT_INTRA_OP_THREADS", os.cpu_count() or 4)
+            )
+            options.inter_op_num_threads = 1
+            options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+            options.enable_cpu_mem_arena = True
+            # The 640x640 input never changes shape, so let ORT plan and reuse
+            # arena allocations across runs instead of re-planning every call.
+            options.enable_mem_pattern = True
+            options.add_session_config_entry("session.use_env_allocators", "1")
+            # Keep intra-op worker threads spinning briefly between runs so
+            # back-to-back inferences don't pay a thread wakeup.
+            options.add_session_config_entry("session.intra_op.allow_spinning", "1")
+            session = ort.InferenceSession(
+                self.model_path, options, providers=providers
+            )
+            print(f"Using execution provider: {session.get_providers()[0]}")
+
+            self.input_name = session.get_inputs()[0].name
+            self.output_names = [output.name for output in session.get_outputs()]
+
+            # Persistent input tensor bound through IOBinding: every detect()
+            # call writes into the same buffer, so ONNX Runtime never
+            # re-copies a fresh ~4.9 MB input array per inference.
+            self._input_buf = np.zeros(
+                (1, 3, self.input_height, self.input_width), np.float32
+            )
+            self._io_binding = session.io_binding()
+            self._input_ortvalue = ort.OrtValue.ortvalue_from_numpy(
+                self._input_buf
+            )
+            self._io_binding.bind_ortvalue_input(
+                self.input_name, self._input_ortvalue
+            )
+            for name in self.output_names:
+                self._io_binding.bind_output(name)
+
+            # Warm up the session once so the first user request doesn't pay
+            # the engine-build / kernel-selection latency (significant with
+            # TensorRT).
+            session.run_with_iobinding(self._io_binding)
+
+            self._session = session
+
+    def run_inference(self, img_data: np.ndarray) -> list:
+        """
+        Runs the model on a preprocessed blob through the pre-bound IOBinding.
+
+        Args:
+            img_data: Preprocessed (1, 3, 640, 640) float32 blob.
+
+        Returns:
+            list: The raw model outputs.
+        """
+        self._ensure_session()
+
+        with self._infer_lock:
+            np.copyto(self._input_buf, img_data)
+            self.session.run_with_iobinding(self._io_binding)
+            return [out.numpy() for out in self._io_binding.get_outputs()]
+
     def update_metrics(self, inference_time: float) -> None:
         """
         Updates metrics in persistent storage.
@@ -109,21 +322,10 @@ class SignatureDetector:
         if not metrics["times"]:
             return None, None, None, None, None, None
 
-        hist_data = pd.DataFrame({"Time (ms)": metrics["times"]})
-        indices = range(
-            metrics["start_index"], metrics["start_index"] + len(metrics["times"])
-        )
-
-        line_data = pd.DataFrame(
-            {
-                "Inference": indices,
-                "Time (ms)": metrics["times"],
-                "Mean": [metrics["avg_time"]] * len(metrics["times"]),
-            }
+        hist_fig, line_fig = self.create_plots(
+            metrics["times"], metrics["avg_time"], metrics["start_index"]
         )
 
-        hist_fig, line_fig = self.create_plots(hist_data, line_data)
-
         return (
             None,
             f"{metrics['total_inferences']}",
@@ -134,25 +336,50 @@ class SignatureDetector:
         )
 
     def create_plots(
-        self, hist_data: pd.DataFrame, line_data: pd.DataFrame
+        self, times: list, avg_time: float, start_index: int
     ) -> Tuple[plt.Figure, plt.Figure]:
         """
         Helper method to create plots.
 
         Args:
-            hist_data (pd.DataFrame): Data for histogram plot.
-            line_data (pd.DataFrame): Data for line plot.
+            times (list): Recent inference times in milliseconds.
+            avg_time (float): Average inference time in milliseconds.
+            start_index (int): Global index of the first entry in times.
 
         Returns:
             tuple: A tuple containing histogram figure and line figure.
         """
-        plt.style.use("dark_background")
+        # The cached figures are still valid if the metrics haven't changed
+        # since the last render.
+        key = (start_index, len(times), round(avg_time, 3))
+        if key == self._plot_cache_key and self._hist_fig is not None:
+            return self._hist_fig, self._line_fig
+
+        # Create both figures once; subsequent refreshes clear and redraw the
+        # same axes instead of paying figure construction per inference.
+        if self._hist_fig is None:
+            self._hist_fig, self._hist_ax = plt.subplots(
+                figsize=(8, 4), facecolor="#f0f0f5"
+            )
+            self._line_fig, self._line_ax = plt.subplots(
+                figsize=(8, 4), facecolor="#f0f0f5"
+            )
 
         # Histogram plot
-        hist_fig, hist_ax = plt.subplots(figsize=(8, 4), facecolor="#f0f0f5")
+        hist_fig, hist_ax = self._hist_fig, self._hist_ax
+        hist_ax.cla()
         hist_ax.set_facecolor("#f0f0f5")
-        hist_data.hist(
-            bins=20, ax=hist_ax, color="#4F46E5", alpha=0.7, edgecolor="white"
+        # One NumPy pass over the window; ax.bar draws the precomputed counts
+        # without matplotlib re-binning the data itself.
+        counts, edges = np.histogram(times, bins=20)
+        hist_ax.bar(
+            edges[:-1],
+            counts,
+            width=np.diff(edges),
+            align="edge",
+            color="#4F46E5",
+            alpha=0.7,
+            edgecolor="white",
         )
         hist_ax.set_title(
             "Distribution of Inference Times",
@@ -166,20 +393,14 @@ class SignatureDetector:
         hist_ax.grid(True, linestyle="--", alpha=0.3)
 
         # Line plot
-        line_fig, line_ax = plt.subplots(figsize=(8, 4), facecolor="#f0f0f5")
+        line_fig, line_ax = self._line_fig, self._line_ax
+        line_ax.cla()
         line_ax.set_facecolor("#f0f0f5")
-        line_data.plot(
-            x="Inference",
-            y="Time (ms)",
-            ax=line_ax,
-            color="#4F46E5",
-            alpha=0.7,
-            label="Time",
-        )
-        line_data.plot(
-            x="Inference",
-            y="Mean",
-            ax=line_ax,
+        indices = range(start_index, start_index + len(times))
+        line_ax.plot(indices, times, color="#4F46E5", alpha=0.7, label="Time")
+        line_ax.plot(
+            indices,
+            np.full(len(times), avg_time),
             color="#DC2626",
             linestyle="--",
             label="Mean",
@@ -198,8 +419,7 @@ class SignatureDetector:
         hist_fig.tight_layout()
         line_fig.tight_layout()
 
-        plt.close(hist_fig)
-        plt.close(line_fig)
+        self._plot_cache_key = key
 
         return hist_fig, line_fig
 
@@ -213,23 +433,43 @@ class SignatureDetector:
         Returns:
             tuple: A tuple containing the processed image data and the original image.
         """
-        # Convert PIL Image to cv2 format
-        img_cv2 = cv2.cvtColor(np.array(img), cv2.COLOR_RGB2BGR)
-
-        self.img_height, self.img_width = img_cv2.shape[:2]
-
-        # Convert back to RGB for processing
-        img_rgb = cv2.cvtColor(img_cv2, cv2.COLOR_BGR2RGB)
-
-        # Resize
-        img_resized = cv2.resize(img_rgb, (self.input_width, self.input_height))
+        # PIL images are already RGB, and the model wants RGB input, so keep
+        # that layout end-to-end instead of converting to BGR and back.
+        # NumPy inputs (e.g. from gr.Image(type="numpy")) are used as-is;
+        # PIL inputs are copied once into a writeable array for drawing.
+        img_rgb = img if isinstance(img, np.ndarray) else np.array(img)
+
+        self.img_height, self.img_width = img_rgb.shape[:2]
+
+        # Letterbox: scale uniformly to preserve aspect ratio and pad the rest
+        # with the YOLO-standard gray, instead of stretching the image. The
+        # reusable scratch buffer doubles as the padded canvas.
+        self.ratio = min(
+            self.input_width / self.img_width, self.input_height / self.img_height
+        )
+        new_width = int(round(self.img_width * self.ratio))
+        new_height = int(round(self.img_height * self.ratio))
+        self.pad_w = (self.input_width - new_width) // 2
+        self.pad_h = (self.input_height - new_height) // 2
+
+        self._resize_buf.fill(114)
+        self._resize_buf[
+            self.pad_h : self.pad_h + new_height,
+            self.pad_w : self.pad_w + new_width,
+        ] = cv2.resize(
+            img_rgb, (new_width, new_height), interpolation=cv2.INTER_LINEAR
+        )
 
-        # Normalize and transpose
-        image_data = np.array(img_resized) / 255.0
-        image_data = np.transpose(image_data, (2, 0, 1))
-        image_data = np.expand_dims(image_data, axis=0).astype(np.float32)
+        # Scale and HWC->NCHW in one fused OpenCV pass that produces the
+        # float32 blob directly.
+        image_data = cv2.dnn.blobFromImage(
+            self._resize_buf,
+            scalefactor=1 / 255.0,
+            swapRB=False,
+            crop=False,
+        )
 
-        return image_data, img_cv2
+        return image_data, img_rgb
 
     def draw_detections(
         self, img: np.ndarray, box: list, score: float, class_id: int
@@ -243,24 +483,19 @@ class SignatureDetector:
             score (float): The confidence score.
             class_id (int): The class ID.
         """
-        x1, y1, w, h = box
-        self.color_palette = np.random.uniform(0, 255, size=(len(self.classes), 3))
+        x1, y1, w, h = (int(value) for value in box)
         color = self.color_palette[class_id]
 
-        cv2.rectangle(img, (int(x1), int(y1)), (int(x1 + w), int(y1 + h)), color, 2)
+        cv2.rectangle(img, (x1, y1), (x1 + w, y1 + h), color, 2)
 
         label = f"{self.classes[class_id]}: {score:.2f}"
-        (label_width, label_height), _ = cv2.getTextSize(
-            label, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1
-        )
 
-        label_x = x1
-        label_y = y1 - 10 if y1 - 10 > label_height else y1 + 10
+        label_y = y1 - 10 if y1 - 10 > self.label_height else y1 + 10
 
         cv2.rectangle(
             img,
-            (int(label_x), int(label_y - label_height)),
-            (int(label_x + label_width), int(label_y + label_height)),
+            (x1, label_y - self.label_height),
+            (x1 + self.label_width, label_y + self.label_height),
             color,
             cv2.FILLED,
         )
@@ -268,7 +503,7 @@ class SignatureDetector:
         cv2.putText(
             img,
             label,
-            (int(label_x), int(label_y)),
+            (x1, label_y),
             cv2.FONT_HERSHEY_SIMPLEX,
             0.5,
             (0, 0, 0),
@@ -295,33 +530,38 @@ class SignatureDetector:
         Returns:
             np.ndarray: The output image with detections drawn
         """
-        outputs = np.transpose(np.squeeze(output[0]))
-        rows = outputs.shape[0]
-
-        boxes = []
-        scores = []
-        class_ids = []
-
-        x_factor = self.img_width / self.input_width
-        y_factor = self.img_height / self.input_height
-
-        for i in range(rows):
-            classes_scores = outputs[i][4:]
-            max_score = np.amax(classes_scores)
-
-            if max_score >= conf_thres:
-                class_id = np.argmax(classes_scores)
-                x, y, w, h = outputs[i][0], outputs[i][1], outputs[i][2], outputs[i][3]
-
-                left = int((x - w / 2) * x_factor)
-                top = int((y - h / 2) * y_factor)
-                width = int(w * x_factor)
-                height = int(h * y_factor)
-
-                class_ids.append(class_id)
-                scores.append(max_score)
-                boxes.append([left, top, width, height])
+        # Keep the model's native (4+nc, rows) layout: transposing up front
+        # would materialize a full contiguous copy of the output tensor just
+        # to swap axes.
+        outputs = np.squeeze(output[0])
+
+        # Filter and decode all candidate boxes in one vectorized pass instead
+        # of iterating over the ~8400 YOLOv8 proposals in Python.
+        classes_scores = outputs[4:]
+        max_scores = classes_scores.max(axis=0)
+        mask = max_scores >= conf_thres
+
+        # Nothing above the confidence threshold: skip decode, NMS and
+        # drawing entirely.
+        if not mask.any():
+            return input_image
+
+        scores = max_scores[mask]
+        class_ids = classes_scores[:, mask].argmax(axis=0)
+
+        # Undo the letterbox with whole-matrix ops on the (4, N) gather:
+        # shift centers to corners, remove the padding offset, then apply
+        # the single uniform scale.
+        xywh = outputs[:4, mask]
+        xywh[:2] -= xywh[2:4] * 0.5
+        xywh[0] -= self.pad_w
+        xywh[1] -= self.pad_h
+        boxes = np.ascontiguousarray(
+            (xywh * np.float32(1.0 / self.ratio)).astype(np.int32).T
+        )
 
+        # cv2.dnn.NMSBoxes accepts the NumPy arrays directly; converting to
+        # Python lists would just round-trip every box through PyObjects.
         indices = cv2.dnn.NMSBoxes(boxes, scores, conf_thres, iou_thres)
 
         for i in indices:
@@ -330,10 +570,16 @@ class SignatureDetector:
             class_id = class_ids[i]
             self.draw_detections(input_image, box, score, class_id)
 
-        return cv2.cvtColor(input_image, cv2.COLOR_BGR2RGB)
+        # The image stayed RGB through the whole pipeline, so no final
+        # BGR->RGB conversion is needed.
+        return input_image
 
     def detect(
-        self, image: Image.Image, conf_thres: float = 0.25, iou_thres: float = 0.5
+        self,
+        image: Image.Image,
+        conf_thres: float = 0.25,
+        iou_thres: float = 0.5,
+        return_metrics: bool = True,
     ) -> Tuple[Image.Image, dict]:
         """
         Detects signatures in the given image.
@@ -342,24 +588,121 @@ class SignatureDetector:
             image: The image to process.
             conf_thres (float): Confidence threshold for detection.
             iou_thres (float): Intersection over Union threshold for detection.
+            return_metrics (bool): Whether to collect and return metrics;
+                callers that discard them can skip the bookkeeping.
 
         Returns:
-            tuple: A tuple containing the output image and metrics.
+            tuple: A tuple containing the output image and metrics
+                (None when return_metrics is False).
         """
-        # Preprocess the image
-        img_data, original_image = self.preprocess(image)
+        # The shared preprocess buffers, letterbox geometry and output cache
+        # make preprocess->postprocess one critical section.
+        with self._infer_lock:
+            # Preprocess the image
+            img_data, original_image = self.preprocess(image)
+
+            # Re-running Detect on the same image with different thresholds
+            # only changes postprocess, so the raw model output is cached
+            # keyed by a hash of the letterboxed input canvas.
+            img_hash = hashlib.blake2b(
+                self._resize_buf.tobytes(), digest_size=16
+            ).digest()
+            if img_hash == self._last_img_hash:
+                outputs = self._last_outputs
+                inference_time = None
+            else:
+                # Run inference through the pre-bound input buffer
+                start_time = time.time()
+                outputs = self.run_inference(img_data)
+                inference_time = (time.time() - start_time) * 1000  # Convert to milliseconds
+                self._last_img_hash = img_hash
+                self._last_outputs = outputs
+
+            # Postprocess the results
+            output_image = self.postprocess(
+                original_image, outputs, conf_thres, iou_thres
+            )
+
+        if not return_metrics:
+            return output_image, None
+
+        # Cache hits skip the model entirely, so there is no new time to
+        # record.
+        if inference_time is not None:
+            self.update_metrics(inference_time)
 
-        # Run inference
-        start_time = time.time()
-        outputs = self.session.run(None, {self.session.get_inputs()[0].name: img_data})
-        inference_time = (time.time() - start_time) * 1000  # Convert to milliseconds
+        return output_image, self.get_metrics()
 
-        # Postprocess the results
-        output_image = self.postprocess(original_image, outputs, conf_thres, iou_thres)
+    def detect_batch(
+        self, images: list, conf_thres: float = 0.25, iou_thres: float = 0.5
+    ) -> Tuple[list, dict]:
+        """
+        Detects signatures in a batch of images with a single inference call.
 
-        self.update_metrics(inference_time)
+        Stacking the preprocessed blobs lets ONNX Runtime amortize weight
+        reads and dispatch overhead across the batch, which is considerably
+        faster than running the images one by one.
 
-        return output_image, self.get_metrics()
+        Args:
+            images: The list of images to process.
+            conf_thres (float): Confidence threshold for detection.
+            iou_thres (float): Intersection over Union threshold for detection.
+
+        Returns:
+            tuple: A tuple containing the list of output images and metrics.
+        """
+        self._ensure_session()
+
+        # Same critical section as detect(): the preprocess buffers and
+        # letterbox geometry are shared instance state.
+        with self._infer_lock:
+            blobs = []
+            originals = []
+            sizes = []
+
+            for image in images:
+                img_data, original_image = self.preprocess(image)
+                blobs.append(img_data)
+                originals.append(original_image)
+                sizes.append(
+                    (
+                        self.img_height,
+                        self.img_width,
+                        self.ratio,
+                        self.pad_w,
+                        self.pad_h,
+                    )
+                )
+
+            batch = np.concatenate(blobs, axis=0)
+
+            # Run inference once for the whole batch
+            start_time = time.time()
+            outputs = self.session.run(self.output_names, {self.input_name: batch})
+            inference_time = (time.time() - start_time) * 1000  # Convert to milliseconds
+
+            output_images = []
+            for i, original_image in enumerate(originals):
+                # Restore this image's letterbox geometry before decoding;
+                # images in the batch can have different sizes.
+                (
+                    self.img_height,
+                    self.img_width,
+                    self.ratio,
+                    self.pad_w,
+                    self.pad_h,
+                ) = sizes[i]
+                output_images.append(
+                    self.postprocess(
+                        original_image, [outputs[0][i : i + 1]], conf_thres, iou_thres
+                    )
+                )
+
+        per_image_time = inference_time / len(images)
+        for _ in images:
+            self.update_metrics(per_image_time)
+
+        return output_images, self.get_metrics()
 
     def detect_example(
         self, image: Image.Image, conf_thres: float = 0.25, iou_thres: float = 0.5
@@ -375,5 +718,7 @@ class SignatureDetector:
         Returns:
             The output image.
         """
-        output_image, _ = self.detect(image, conf_thres, iou_thres)
+        output_image, _ = self.detect(
+            image, conf_thres, iou_thres, return_metrics=False
+        )
         return output_image
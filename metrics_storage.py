@@ -1,18 +1,52 @@
+import atexit
 import sqlite3
+import threading
+import time
+from collections import deque
 
 from constants import DATABASE_PATH
 
 
 class MetricsStorage:
+    WINDOW_SIZE = 80
+    # Pending inserts are flushed to SQLite once either bound is hit, so the
+    # database sees one transaction per batch instead of one fsync per metric.
+    FLUSH_BATCH_SIZE = 20
+    FLUSH_INTERVAL_SECONDS = 1.0
+
     def __init__(self, db_path=DATABASE_PATH):
         self.db_path = db_path
+        # One persistent connection instead of a connect/commit/close cycle
+        # per operation. WAL journaling with synchronous=NORMAL turns each
+        # commit into a sequential WAL append rather than a full fsync of the
+        # main database file. Gradio may call from worker threads, hence
+        # check_same_thread=False plus an explicit lock.
+        self._conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._lock = threading.Lock()
+        self._pending = deque()
+        self._last_flush = time.monotonic()
         self.setup_database()
+        # In-memory mirror of the recent window so the per-inference reads
+        # (recent times, total count, average) are O(1) instead of hitting
+        # SQLite. The running sum keeps the average incremental: when the
+        # deque is full, the evicted value is subtracted before the new one
+        # is added.
+        self._recent = deque(maxlen=self.WINDOW_SIZE)
+        self._sum = 0.0
+        self._total = 0
+        self._load_from_database()
+        # Buffered metrics would otherwise be lost on interpreter exit.
+        atexit.register(self.flush)
 
     def setup_database(self):
         """Initialize the SQLite database and create tables if they don't exist"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
+        with self._lock:
+            self._conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS inference_metrics (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -21,43 +55,77 @@ class MetricsStorage:
                 )
             """
             )
-            conn.commit()
 
-    def add_metric(self, inference_time):
-        """Add a new inference time measurement to the database"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "INSERT INTO inference_metrics (inference_time) VALUES (?)",
-                (inference_time,),
-            )
-            conn.commit()
-
-    def get_recent_metrics(self, limit=80):
-        """Get the most recent metrics from the database"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT inference_time FROM inference_metrics ORDER BY timestamp DESC LIMIT ?",
-                (limit,),
+    def _load_from_database(self):
+        """Seed the in-memory window and counters from persisted metrics"""
+        with self._lock:
+            cursor = self._conn.execute("SELECT COUNT(*) FROM inference_metrics")
+            self._total = cursor.fetchone()[0]
+            cursor = self._conn.execute(
+                "SELECT inference_time FROM inference_metrics ORDER BY id DESC LIMIT ?",
+                (self.WINDOW_SIZE,),
             )
             results = cursor.fetchall()
-            return [r[0] for r in reversed(results)]
+            for (value,) in reversed(results):
+                self._recent.append(value)
+                self._sum += value
+
+    def _flush_pending_locked(self):
+        """Write all buffered metrics in a single transaction (lock held)"""
+        if not self._pending:
+            return
+        rows = [(value,) for value in self._pending]
+        self._pending.clear()
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.executemany(
+                "INSERT INTO inference_metrics (inference_time) VALUES (?)", rows
+            )
+            self._conn.execute("COMMIT")
+        except sqlite3.Error:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._last_flush = time.monotonic()
+
+    def flush(self):
+        """Persist any buffered metrics immediately"""
+        with self._lock:
+            self._flush_pending_locked()
+
+    def add_metric(self, inference_time):
+        """Record a new inference time measurement"""
+        with self._lock:
+            self._pending.append(inference_time)
+            if (
+                len(self._pending) >= self.FLUSH_BATCH_SIZE
+                or time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL_SECONDS
+            ):
+                self._flush_pending_locked()
+            if len(self._recent) == self._recent.maxlen:
+                self._sum -= self._recent[0]
+            self._recent.append(inference_time)
+            self._sum += inference_time
+            self._total += 1
+
+    def get_recent_metrics(self, limit=None):
+        """Get the most recent metrics from the in-memory window"""
+        with self._lock:
+            times = list(self._recent)
+        if limit is not None and limit < len(times):
+            times = times[-limit:]
+        return times
 
     def get_total_inferences(self):
         """Get the total number of inferences recorded"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM inference_metrics")
-            return cursor.fetchone()[0]
-
-    def get_average_time(self, limit=80):
-        """Get the average inference time from the most recent entries"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT AVG(inference_time) FROM (SELECT inference_time FROM inference_metrics ORDER BY timestamp DESC LIMIT ?)",
-                (limit,),
-            )
-            result = cursor.fetchone()[0]
-            return result if result is not None else 0
+        with self._lock:
+            return self._total
+
+    def get_average_time(self, limit=None):
+        """Get the average inference time over the recent window"""
+        with self._lock:
+            if limit is None or limit >= len(self._recent):
+                if not self._recent:
+                    return 0
+                return self._sum / len(self._recent)
+            times = list(self._recent)[-limit:]
+        return sum(times) / len(times) if times else 0
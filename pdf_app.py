@@ -4,7 +4,6 @@ import numpy as np
 import cv2
 
 import gradio as gr
-import pandas as pd
 import matplotlib.pyplot as plt
 from PIL import Image
 
@@ -123,12 +122,13 @@ def create_pdf_gradio_interface():
         
         # Get model output for cropping
         img_data, _ = detector.preprocess(image)
-        outputs = detector.session.run(None, {detector.session.get_inputs()[0].name: img_data})
+        outputs = detector.run_inference(img_data)
         
         # Extract boxes
         boxes = signature_cropper.extract_boxes_from_output(
             img_cv2, outputs, conf_thres, iou_thres,
-            img_width, img_height, 640, 640
+            img_width, img_height, 640, 640,
+            ratio=detector.ratio, pad_w=detector.pad_w, pad_h=detector.pad_h
         )
         
         # Crop signatures
@@ -142,22 +142,10 @@ def create_pdf_gradio_interface():
             signature_gallery = []
             sig_count_text = "No signatures detected"
 
-        # Create plots data
-        hist_data = pd.DataFrame({"Time (ms)": metrics["times"]})
-        indices = range(
-            metrics["start_index"], metrics["start_index"] + len(metrics["times"])
+        hist_fig, line_fig = detector.create_plots(
+            metrics["times"], metrics["avg_time"], metrics["start_index"]
         )
 
-        line_data = pd.DataFrame(
-            {
-                "Inference": indices,
-                "Time (ms)": metrics["times"],
-                "Mean": [metrics["avg_time"]] * len(metrics["times"]),
-            }
-        )
-
-        hist_fig, line_fig = detector.create_plots(hist_data, line_data)
-
         return (
             output_image,
             page_info,
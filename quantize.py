@@ -0,0 +1,95 @@
+"""
+One-time post-training INT8 quantization of the signature detection model.
+
+Run after the FP32 model has been downloaded (see detector.download_model):
+
+    python quantize.py
+
+Produces model/model.int8.onnx. On CPU-only deployments SignatureDetector
+automatically prefers the INT8 model, whose convolutions map to VNNI/AVX
+int8 dot-product kernels for a 2-4x speedup over FP32.
+"""
+
+import glob
+import os
+
+import onnxruntime as ort
+from PIL import Image
+from onnxruntime.quantization import (
+    CalibrationDataReader,
+    QuantFormat,
+    QuantType,
+    quantize_static,
+)
+
+from constants import DATABASE_DIR, MODEL_PATH, MODEL_PATH_INT8
+from detector import SignatureDetector
+
+CALIBRATION_IMAGE_DIR = os.path.join("assets", "images")
+
+
+class ImageCalibrationDataReader(CalibrationDataReader):
+    """Feeds preprocessed example images to the quantization calibrator."""
+
+    def __init__(self, image_dir: str, input_name: str, detector: SignatureDetector):
+        self.input_name = input_name
+        # Calibration must see exactly the input distribution inference sees,
+        # so the blobs come from the detector's own letterbox preprocess
+        # (uniform scale plus gray padding), not a plain stretched resize.
+        self.detector = detector
+        self.image_paths = sorted(glob.glob(os.path.join(image_dir, "*.jpg")))
+        self._iterator = iter(self.image_paths)
+
+    def get_next(self):
+        path = next(self._iterator, None)
+        if path is None:
+            return None
+
+        blob, _ = self.detector.preprocess(Image.open(path).convert("RGB"))
+        return {self.input_name: blob}
+
+    def rewind(self):
+        self._iterator = iter(self.image_paths)
+
+
+def quantize_model(model_path: str = MODEL_PATH, output_path: str = MODEL_PATH_INT8):
+    """
+    Quantize the FP32 ONNX model to INT8 using static quantization.
+
+    Args:
+        model_path (str): Path to the FP32 ONNX model.
+        output_path (str): Path for the quantized INT8 model.
+    """
+    if not os.path.exists(model_path):
+        raise FileNotFoundError(
+            f"Model not found at {model_path}. Run the app once to download it."
+        )
+
+    session = ort.InferenceSession(
+        model_path, providers=["CPUExecutionProvider"]
+    )
+    input_name = session.get_inputs()[0].name
+
+    # Only the preprocess path of the detector is used; its session stays
+    # unbuilt. Constructing it opens the metrics database, so make sure the
+    # directory exists as app.py does.
+    os.makedirs(DATABASE_DIR, exist_ok=True)
+    detector = SignatureDetector(model_path)
+
+    print(f"Quantizing {model_path} -> {output_path}...")
+    quantize_static(
+        model_input=model_path,
+        model_output=output_path,
+        calibration_data_reader=ImageCalibrationDataReader(
+            CALIBRATION_IMAGE_DIR, input_name, detector
+        ),
+        quant_format=QuantFormat.QDQ,
+        activation_type=QuantType.QInt8,
+        weight_type=QuantType.QInt8,
+        per_channel=True,
+    )
+    print("Quantization complete!")
+
+
+if __name__ == "__main__":
+    quantize_model()
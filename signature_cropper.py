@@ -29,11 +29,14 @@ class SignatureCropper:
         img_width: int,
         img_height: int,
         input_width: int = 640,
-        input_height: int = 640
+        input_height: int = 640,
+        ratio: float = None,
+        pad_w: int = 0,
+        pad_h: int = 0
     ) -> List[Tuple[int, int, int, int, float]]:
         """
         Extract bounding boxes from model output.
-        
+
         Args:
             original_image: Original image array
             output: Model output array
@@ -43,44 +46,60 @@ class SignatureCropper:
             img_height: Original image height
             input_width: Model input width
             input_height: Model input height
-            
+            ratio: Uniform letterbox scale used during preprocessing.
+                When None, a plain-resize decode is assumed.
+            pad_w: Horizontal letterbox padding in model-input pixels
+            pad_h: Vertical letterbox padding in model-input pixels
+
         Returns:
             List of tuples (x, y, width, height, confidence)
         """
-        outputs = np.transpose(np.squeeze(output[0]))
-        rows = outputs.shape[0]
-        
-        boxes = []
-        scores = []
-        valid_boxes = []
-        
-        x_factor = img_width / input_width
-        y_factor = img_height / input_height
-        
-        for i in range(rows):
-            classes_scores = outputs[i][4:]
-            max_score = np.amax(classes_scores)
-            
-            if max_score >= conf_thres:
-                x, y, w, h = outputs[i][0], outputs[i][1], outputs[i][2], outputs[i][3]
-                
-                left = int((x - w / 2) * x_factor)
-                top = int((y - h / 2) * y_factor)
-                width = int(w * x_factor)
-                height = int(h * y_factor)
-                
-                boxes.append([left, top, width, height])
-                scores.append(float(max_score))
-        
+        # Work on the model's native (4+nc, rows) layout; transposing first
+        # would copy the whole output tensor just to swap axes.
+        outputs = np.squeeze(output[0])
+
+        # Filter and decode every candidate box in one vectorized NumPy pass
+        # instead of iterating the proposals in Python.
+        classes_scores = outputs[4:]
+        max_scores = classes_scores.max(axis=0)
+        mask = max_scores >= conf_thres
+
+        scores = max_scores[mask].astype(np.float32)
+
+        x, y, w, h = (
+            outputs[0, mask],
+            outputs[1, mask],
+            outputs[2, mask],
+            outputs[3, mask],
+        )
+        if ratio is not None:
+            # Undo the letterbox applied by the detector's preprocess
+            left = ((x - w / 2 - pad_w) / ratio).astype(np.int32)
+            top = ((y - h / 2 - pad_h) / ratio).astype(np.int32)
+            width = (w / ratio).astype(np.int32)
+            height = (h / ratio).astype(np.int32)
+        else:
+            x_factor = img_width / input_width
+            y_factor = img_height / input_height
+            left = ((x - w / 2) * x_factor).astype(np.int32)
+            top = ((y - h / 2) * y_factor).astype(np.int32)
+            width = (w * x_factor).astype(np.int32)
+            height = (h * y_factor).astype(np.int32)
+
+        boxes = np.stack([left, top, width, height], axis=1)
+
         # Apply Non-Maximum Suppression
-        if boxes:
+        valid_boxes = []
+        if len(boxes):
             indices = cv2.dnn.NMSBoxes(boxes, scores, conf_thres, iou_thres)
-            
+
             for i in indices:
                 box = boxes[i]
-                score = scores[i]
-                valid_boxes.append((box[0], box[1], box[2], box[3], score))
-        
+                valid_boxes.append(
+                    (int(box[0]), int(box[1]), int(box[2]), int(box[3]),
+                     float(scores[i]))
+                )
+
         return valid_boxes
     
     def crop_signature(